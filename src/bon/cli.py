@@ -15,6 +15,7 @@ from bon.storage import (
     append_archive,
     apply_reorder,
     apply_reparent,
+    build_id_index,
     check_initialized,
     error,
     find_active_tactical,
@@ -656,8 +657,9 @@ def cmd_archive(args):
             return
     elif args.ids:
         to_archive = []
+        index = build_id_index(items)
         for item_id in args.ids:
-            item = find_by_id(items, item_id, prefix)
+            item = find_by_id(items, item_id, prefix, index=index)
             if not item:
                 error(f"Item '{item_id}' not found")
             if item["status"] != "done":
@@ -824,6 +826,12 @@ def add_output_flags(subparser, json=False, jsonl=False, quiet=False):
         subparser.add_argument("--quiet", "-q", action="store_true", help="Minimal output")
 
 
+# Step number must be at start or after whitespace (prevents matching "v2.0")
+# Delimiter (. or )) must be followed by whitespace
+# Lookahead requires whitespace before next step number AND after delimiter
+_STEP_RE = re.compile(r'(?:^|(?<=\s))(\d+)[.)]\s+(.+?)(?=\s+\d+[.)]\s|$)')
+
+
 def parse_steps_from_what(what: str) -> list[str] | None:
     """Extract numbered steps from --what field.
 
@@ -834,11 +842,7 @@ def parse_steps_from_what(what: str) -> list[str] | None:
     """
     # Normalize: collapse newlines and extra whitespace to single spaces
     normalized = ' '.join(what.split())
-    # Step number must be at start or after whitespace (prevents matching "v2.0")
-    # Delimiter (. or )) must be followed by whitespace
-    # Lookahead requires whitespace before next step number AND after delimiter
-    pattern = r'(?:^|(?<=\s))(\d+)[.)]\s+(.+?)(?=\s+\d+[.)]\s|$)'
-    matches = re.findall(pattern, normalized)
+    matches = _STEP_RE.findall(normalized)
     if not matches:
         return None
     steps = [m[1].strip() for m in matches if m[1].strip()]
@@ -1030,8 +1034,8 @@ def cmd_update(args):
         print(f"Updated: {new_version}")
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
     parser = argparse.ArgumentParser(
         prog="bon",
         description="Work tracker for Claude-human collaboration"
@@ -1152,7 +1156,32 @@ def main():
     help_parser.add_argument("command_name", nargs="?", help="Command to get help for")
     help_parser.set_defaults(func=lambda args: cmd_help(args, parser))
 
-    args = parser.parse_args()
+    return parser
+
+
+_cached_parser: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the argument parser, building it on first use.
+
+    The parser holds no per-invocation state, so repeated main() calls in one
+    process (e.g. the test suite) can share it.
+    """
+    global _cached_parser
+    if _cached_parser is None:
+        _cached_parser = build_parser()
+    return _cached_parser
+
+
+def main(argv: list[str] | None = None):
+    """Main CLI entry point.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
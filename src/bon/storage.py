@@ -79,7 +79,7 @@ def load_items() -> list[dict]:
 
     seen: dict[str, dict] = {}  # id -> item (best version wins)
     duplicates: set[str] = set()
-    for line_num, line in enumerate(path.read_text().splitlines(), 1):
+    for line_num, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
         line = line.strip()
         if not line:
             continue
@@ -144,6 +144,14 @@ def validate_item(item: dict, strict: bool = False) -> None:
                 raise ValidationError(f"Missing brief.{subfield}")
 
 
+def _write_jsonl(path: Path, items: list[dict]) -> None:
+    """Write items as UTF-8 JSONL atomically: one write to .tmp, then replace."""
+    payload = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(payload.encode("utf-8"))
+    tmp.replace(path)  # os.replace: atomic, and overwrites on Windows too
+
+
 def save_items(items: list[dict]) -> None:
     """Save items atomically, sorted by ID for deterministic output.
 
@@ -169,14 +177,8 @@ def save_items(items: list[dict]) -> None:
         ids = ", ".join(sorted(duplicates))
         print(f"Warning: Deduplicated IDs on save: {ids}", file=sys.stderr)
 
-    path = _data_dir() / "items.jsonl"
-    tmp = path.with_suffix(".tmp")
-
-    with open(tmp, "w") as f:
-        for item in sorted(seen.values(), key=lambda i: i.get("id", "")):
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-    tmp.rename(path)  # Atomic on POSIX
+    _write_jsonl(_data_dir() / "items.jsonl",
+                 sorted(seen.values(), key=lambda i: i.get("id", "")))
 
 
 def load_prefix() -> str:
@@ -187,7 +189,23 @@ def load_prefix() -> str:
     return "bon"
 
 
-def find_by_id(items: list[dict], item_id: str, prefix: str | None = None) -> dict | None:
+def build_id_index(items: list[dict]) -> dict[str, dict]:
+    """Map ID -> item for repeated find_by_id lookups over the same list.
+
+    Keeps the first item for a duplicated ID, matching find_by_id's scan order.
+    """
+    index: dict[str, dict] = {}
+    for item in items:
+        index.setdefault(item["id"], item)
+    return index
+
+
+def find_by_id(
+    items: list[dict],
+    item_id: str,
+    prefix: str | None = None,
+    index: dict[str, dict] | None = None,
+) -> dict | None:
     """Find item by ID. Returns None if not found.
 
     Searches all items regardless of status (open or done).
@@ -197,15 +215,26 @@ def find_by_id(items: list[dict], item_id: str, prefix: str | None = None) -> di
         items: All items to search
         item_id: The ID to find (full or suffix)
         prefix: Current prefix for prefix-tolerant matching
+        index: Optional build_id_index(items) result; makes the lookup O(1)
+            when resolving several IDs against the same items
     """
+    prefixed = None
+    if prefix and not item_id.startswith(prefix + "-"):
+        prefixed = f"{prefix}-{item_id}"
+
+    if index is not None:
+        item = index.get(item_id)
+        if item is None and prefixed:
+            item = index.get(prefixed)
+        return item
+
     # Exact match first
     for item in items:
         if item["id"] == item_id:
             return item
 
     # Prefix-tolerant: try prepending prefix
-    if prefix and not item_id.startswith(prefix + "-"):
-        prefixed = f"{prefix}-{item_id}"
+    if prefixed:
         for item in items:
             if item["id"] == prefixed:
                 return item
@@ -216,6 +245,12 @@ def find_by_id(items: list[dict], item_id: str, prefix: str | None = None) -> di
 _creator_cache: str | None = None
 
 
+def _reset_creator_cache() -> None:
+    """Reset cached creator. For tests only."""
+    global _creator_cache
+    _creator_cache = None
+
+
 def get_creator() -> str:
     """Get creator identifier for new items.
 
@@ -380,7 +415,7 @@ def load_archive() -> list[dict]:
         return []
 
     items = []
-    for line_num, line in enumerate(path.read_text().splitlines(), 1):
+    for line_num, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
         line = line.strip()
         if not line:
             continue
@@ -410,13 +445,8 @@ def append_archive(items: list[dict]) -> None:
         else:
             seen[item_id] = item
 
-    path = _data_dir() / "archive.jsonl"
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        for item in sorted(seen.values(), key=lambda i: i.get("id", "")):
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-    tmp.rename(path)  # Atomic on POSIX
+    _write_jsonl(_data_dir() / "archive.jsonl",
+                 sorted(seen.values(), key=lambda i: i.get("id", "")))
 
 
 def remove_from_archive(item_id: str, prefix: str | None = None) -> dict | None:
@@ -430,12 +460,7 @@ def remove_from_archive(item_id: str, prefix: str | None = None) -> dict | None:
         return None
 
     remaining = [i for i in archived if i["id"] != item["id"]]
-    path = _data_dir() / "archive.jsonl"
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        for i in remaining:
-            f.write(json.dumps(i, ensure_ascii=False) + "\n")
-    tmp.rename(path)
+    _write_jsonl(_data_dir() / "archive.jsonl", remaining)
 
     return item
 
@@ -1,25 +1,77 @@
 """Pytest configuration and fixtures."""
+import functools
+import io
+import json
+import os
 import subprocess
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from bon.storage import _reset_data_dir
+# Imported once per session: run_arc calls main() in-process instead of
+# paying interpreter startup + package import for every CLI invocation.
+from bon.cli import main as bon_main
+from bon.storage import _reset_creator_cache, _reset_data_dir
+
+
+def pytest_configure(config):
+    """Root tmp_path on tmpfs (/dev/shm) when available.
+
+    Tests do many tiny writes to .bon/; tmpfs keeps them off disk. An explicit
+    --basetemp or PYTEST_DEBUG_TEMPROOT still wins.
+    """
+    shm = "/dev/shm"
+    if (
+        config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and os.path.isdir(shm)
+        and os.access(shm, os.W_OK)
+    ):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = shm
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip @pytest.mark.slow tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow: pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(autouse=True)
 def _reset_storage_cache():
-    """Reset cached data dir between tests so monkeypatch.chdir works."""
+    """Reset cached data dir and creator between tests so monkeypatch.chdir works."""
     _reset_data_dir()
+    _reset_creator_cache()
     yield
     _reset_data_dir()
+    _reset_creator_cache()
 
 
-@pytest.fixture
-def fixtures_dir():
-    """Return path to fixtures directory."""
-    return Path(__file__).parent.parent / "fixtures"
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@functools.cache
+def fixture_bytes(name: str) -> bytes:
+    """Return a fixture's JSONL content, read from disk once per session.
+
+    Unknown fixture names yield empty content.
+    """
+    fixture_file = FIXTURES_DIR / f"{name}.jsonl"
+    return fixture_file.read_bytes() if fixture_file.exists() else b""
 
 
 @pytest.fixture
@@ -33,32 +85,131 @@ def arc_dir(tmp_path):
 
 
 @pytest.fixture
-def arc_dir_with_fixture(request, tmp_path, fixtures_dir):
+def arc_dir_with_fixture(request, tmp_path):
     """Load a specific fixture into .bon/.
 
+    fixtures/<name>.jsonl becomes items.jsonl; fixtures/<name>.archive.jsonl,
+    if present, becomes archive.jsonl.
+
     Usage:
         @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
         def test_something(arc_dir_with_fixture):
             ...
     """
-    fixture_name = request.param
     arc_path = tmp_path / ".bon"
     arc_path.mkdir()
-
-    fixture_file = fixtures_dir / f"{fixture_name}.jsonl"
-    if fixture_file.exists():
-        content = fixture_file.read_text()
-    else:
-        content = ""
-
-    (arc_path / "items.jsonl").write_text(content)
+    (arc_path / "items.jsonl").write_bytes(fixture_bytes(request.param))
+    archive = fixture_bytes(f"{request.param}.archive")
+    if archive:
+        (arc_path / "archive.jsonl").write_bytes(archive)
     (arc_path / "prefix").write_text("arc")
     return tmp_path
 
 
+def make_session(base, name):
+    """Create base/name as a second worktree sharing base/.bon via symlink."""
+    session = base / name
+    session.mkdir()
+    (session / ".bon").symlink_to(base / ".bon")
+    return session
+
+
+def load_jsonl(path):
+    """Parse a JSONL file into a list of dicts, skipping blank lines."""
+    return [json.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+def items_path(base):
+    """Return base/.bon/items.jsonl; tests use this instead of building the path by hand."""
+    return base / ".bon" / "items.jsonl"
+
+
+def read_items(base):
+    """Return all items from base/.bon/items.jsonl, reading the file directly."""
+    return load_jsonl(items_path(base))
+
+
+def dump_jsonl(path, items):
+    """Write items to path as JSONL, in the given order, with a single write."""
+    payload = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items)
+    path.write_bytes(payload.encode("utf-8"))
+
+
+def write_items(base, items):
+    """Overwrite base/.bon/items.jsonl with items, sorted by ID like save_items."""
+    dump_jsonl(items_path(base), sorted(items, key=lambda i: i.get("id", "")))
+
+
+def by_id(items):
+    """Index items by ID for repeated lookups."""
+    return {item["id"]: item for item in items}
+
+
+def read_item(base, item_id):
+    """Return the item with item_id from base/.bon/items.jsonl, reading the file directly."""
+    for item in read_items(base):
+        if item["id"] == item_id:
+            return item
+    raise KeyError(item_id)
+
+
 def run_arc(*args, cwd=None, env=None, input=None):
-    """Run arc CLI and return result."""
-    result = subprocess.run(
+    """Run arc CLI in-process and return a CompletedProcess.
+
+    Keeps the subprocess contract tests rely on: runs in `cwd`, feeds `input`
+    as a non-TTY stdin, replaces the environment when `env` is given, and maps
+    SystemExit (or an uncaught exception) to a return code.
+
+    Output goes to fresh StringIO buffers, bypassing pytest's capsys: inspect
+    result.stdout/result.stderr, not capsys.readouterr().
+
+    Set BON_TEST_SUBPROCESS=1 to run every call through run_arc_subprocess
+    instead, e.g. to check nothing depends on in-process state.
+    """
+    if os.environ.get("BON_TEST_SUBPROCESS"):
+        return run_arc_subprocess(*args, cwd=cwd, env=env, input=input)
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    old_cwd = os.getcwd()
+    returncode = 0
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        _reset_data_dir()
+        _reset_creator_cache()
+        with (
+            patch.dict(os.environ, env or {}, clear=env is not None),
+            patch("sys.stdin", io.StringIO(input or "")),
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+        ):
+            try:
+                bon_main(list(args))
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    returncode = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        os.chdir(old_cwd)
+        _reset_data_dir()
+        _reset_creator_cache()
+    return subprocess.CompletedProcess(
+        ["bon", *args], returncode, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+def run_arc_subprocess(*args, cwd=None, env=None, input=None):
+    """Run arc CLI in a real subprocess via `python -m bon.cli`.
+
+    Slow; reserved for the few tests that exercise the interpreter entry point
+    itself. Everything else should use run_arc.
+    """
+    return subprocess.run(
         [sys.executable, "-m", "bon.cli", *args],
         capture_output=True,
         text=True,
@@ -66,4 +217,40 @@ def run_arc(*args, cwd=None, env=None, input=None):
         env=env,
         input=input,
     )
-    return result
+
+
+def new_item(cwd, title, *args):
+    """Create an item via `bon new --quiet` and return its ID from stdout.
+
+    Extra args (e.g. "--for", "arc-aaa") are passed through; brief is placeholder text.
+    """
+    result = run_arc(
+        "new", title, "--quiet", "--why", "w", "--what", "x", "--done", "d", *args, cwd=cwd
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def assert_ids(items, present=(), absent=()):
+    """Assert which item IDs appear in items, reporting every mismatch at once."""
+    seen = {item["id"] for item in items}
+    missing = set(present) - seen
+    extra = set(absent) & seen
+    assert not missing, f"missing: {sorted(missing)}"
+    assert not extra, f"unexpectedly present: {sorted(extra)}"
+
+
+def assert_iso_timestamp(value):
+    """Assert value is a valid UTC timestamp in now_iso() form (YYYY-MM-DDTHH:MM:SSZ).
+
+    Parses with datetime.fromisoformat, so out-of-range fields fail too, not just shape.
+    """
+    parsed = datetime.fromisoformat(value)
+    assert parsed.utcoffset() == timedelta(0), f"not UTC: {value!r}"
+    assert parsed.strftime("%Y-%m-%dT%H:%M:%SZ") == value, f"not now_iso() form: {value!r}"
+
+
+def assert_stderr_contains(result, *fragments):
+    """Assert every fragment appears in result.stderr, reporting all that are missing."""
+    missing = [f for f in fragments if f not in result.stderr]
+    assert not missing, f"missing from stderr: {missing}\nstderr was:\n{result.stderr}"
@@ -1,13 +1,8 @@
 """Tests for arc archive command."""
 import json
-import re
 
 import pytest
-
-from conftest import run_arc
-
-ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
-
+from conftest import assert_iso_timestamp, new_item, read_items, run_arc
 
 # --- Fixtures ---
 
@@ -15,12 +10,7 @@ ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
 @pytest.fixture
 def done_action(arc_dir):
     """Create a single done action."""
-    result = run_arc(
-        "new", "Done thing",
-        "--why", "test", "--what", "test", "--done", "test",
-        cwd=arc_dir,
-    )
-    item_id = result.stdout.strip().split(": ")[1]
+    item_id = new_item(arc_dir, "Done thing")
     run_arc("done", item_id, cwd=arc_dir)
     return arc_dir, item_id
 
@@ -52,12 +42,7 @@ def test_archive_single_done_action(done_action):
 
 def test_archive_open_item_errors(arc_dir):
     """Cannot archive an open item."""
-    result = run_arc(
-        "new", "Open thing",
-        "--why", "test", "--what", "test", "--done", "test",
-        cwd=arc_dir,
-    )
-    item_id = result.stdout.strip().split(": ")[1]
+    item_id = new_item(arc_dir, "Open thing")
     result = run_arc("archive", item_id, cwd=arc_dir)
     assert result.returncode == 1
     assert "not done" in result.stderr
@@ -88,9 +73,7 @@ def test_archive_all(arc_dir_with_fixture):
     assert "Archived" in result.stdout
 
     # Only open items remain
-    items_path = arc_dir_with_fixture / ".bon" / "items.jsonl"
-    remaining = [json.loads(line) for line in items_path.read_text().splitlines() if line.strip()]
-    for item in remaining:
+    for item in read_items(arc_dir_with_fixture):
         assert item["status"] == "open"
 
     # Archived items are in archive.jsonl
@@ -126,9 +109,7 @@ def test_archive_outcome_cascades_actions(arc_dir_with_fixture):
     assert archived_ids == {"arc-aaa", "arc-bbb", "arc-ccc"}
 
     # items.jsonl is empty
-    items_path = arc_dir_with_fixture / ".bon" / "items.jsonl"
-    remaining = [line for line in items_path.read_text().splitlines() if line.strip()]
-    assert len(remaining) == 0
+    assert read_items(arc_dir_with_fixture) == []
 
 
 @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
@@ -160,12 +141,7 @@ def test_archive_appends(done_action):
     arc_dir, first_id = done_action
 
     # Create and archive a second item
-    result = run_arc(
-        "new", "Another done thing",
-        "--why", "test", "--what", "test", "--done", "test",
-        cwd=arc_dir,
-    )
-    second_id = result.stdout.strip().split(": ")[1]
+    second_id = new_item(arc_dir, "Another done thing")
     run_arc("done", second_id, cwd=arc_dir)
 
     # Archive first
@@ -212,4 +188,4 @@ class TestArchiveUpdatedAt:
         assert len(archived) > 0
         for item in archived:
             assert "updated_at" in item
-            assert ISO_RE.match(item["updated_at"])
+            assert_iso_timestamp(item["updated_at"])
@@ -1,69 +1,60 @@
 """Tests for arc convert command."""
-import json
-import re
-
 import pytest
-from conftest import run_arc
-
-ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+from conftest import (
+    assert_iso_timestamp,
+    assert_stderr_contains,
+    by_id,
+    read_item,
+    read_items,
+    run_arc,
+)
 
 
 class TestConvertActionToOutcome:
     """Test converting action → outcome."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_action_to_outcome(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_action_to_outcome(self, arc_dir_with_fixture):
         """Basic action → outcome conversion."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-ccc is an action under arc-aaa
         result = run_arc("convert", "arc-ccc", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "Converted arc-ccc to outcome" in result.stdout
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-ccc"]["type"] == "outcome"
         assert items["arc-ccc"].get("parent") is None
         assert "waiting_for" not in items["arc-ccc"]
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_action_assigns_order(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_action_assigns_order(self, arc_dir_with_fixture):
         """Converted action gets appended to outcomes."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-ccc", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         # arc-aaa is outcome at order 1, arc-ccc should be at order 2
         assert items["arc-ccc"]["order"] == 2
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_waiting"], indirect=True)
-    def test_convert_waiting_action_clears_waiting_for(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_waiting_action_clears_waiting_for(self, arc_dir_with_fixture):
         """Converting waiting action clears waiting_for."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-bbb", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-bbb"]["type"] == "outcome"
         assert "waiting_for" not in items["arc-bbb"]
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_action_closes_gap(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_action_closes_gap(self, arc_dir_with_fixture):
         """Converting action closes gap in old parent's ordering."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # First add a third action
         run_arc("new", "Third action", "--for", "arc-aaa",
                 "--why", "w", "--what", "x", "--done", "d",
@@ -74,8 +65,7 @@ class TestConvertActionToOutcome:
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         # arc-ccc was order 2, should now be order 1
         assert items["arc-ccc"]["order"] == 1
@@ -85,36 +75,30 @@ class TestConvertOutcomeToAction:
     """Test converting outcome → action."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["two_outcomes_no_children"], indirect=True)
-    def test_convert_outcome_to_action(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_to_action(self, arc_dir_with_fixture):
         """Basic outcome → action conversion."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # Convert arc-bbb (outcome with no children) to action under arc-aaa
         result = run_arc("convert", "arc-bbb", "--parent", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "Converted arc-bbb to action" in result.stdout
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-bbb"]["type"] == "action"
         assert items["arc-bbb"]["parent"] == "arc-aaa"
         assert items["arc-bbb"]["waiting_for"] is None
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["multiple_outcomes"], indirect=True)
-    def test_convert_outcome_appends_to_parent(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_appends_to_parent(self, arc_dir_with_fixture):
         """Converted outcome appended to end of parent's actions."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-bbb has arc-ddd as child, use --force to convert
         # arc-aaa already has arc-ccc as action at order 1
         result = run_arc("convert", "arc-bbb", "--parent", "arc-aaa", "--force", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         # arc-bbb should be at order 2 (after arc-ccc at order 1)
         assert items["arc-bbb"]["order"] == 2
@@ -124,40 +108,32 @@ class TestConvertValidation:
     """Test convert command validation."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["multiple_outcomes"], indirect=True)
-    def test_convert_outcome_requires_parent(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_requires_parent(self, arc_dir_with_fixture):
         """Converting outcome without --parent is an error."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "requires --outcome" in result.stderr
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_action_rejects_parent(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_action_rejects_parent(self, arc_dir_with_fixture):
         """Converting action with --parent is an error."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-ccc", "--parent", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "don't specify --outcome" in result.stderr
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["multiple_outcomes"], indirect=True)
-    def test_convert_outcome_parent_not_found(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_parent_not_found(self, arc_dir_with_fixture):
         """Error when parent doesn't exist."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-bbb", "--parent", "arc-nonexistent", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "Parent 'arc-nonexistent' not found" in result.stderr
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["multiple_outcomes"], indirect=True)
-    def test_convert_outcome_parent_must_be_outcome(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_parent_must_be_outcome(self, arc_dir_with_fixture):
         """Error when parent is an action."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-ccc is an action
         result = run_arc("convert", "arc-bbb", "--parent", "arc-ccc", cwd=arc_dir_with_fixture)
 
@@ -165,19 +141,15 @@ class TestConvertValidation:
         assert "Parent must be an outcome" in result.stderr
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_convert_item_not_found(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_item_not_found(self, arc_dir_with_fixture):
         """Error when item doesn't exist."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-nonexistent", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "Item 'arc-nonexistent' not found" in result.stderr
 
-    def test_convert_not_initialized(self, tmp_path, monkeypatch):
+    def test_convert_not_initialized(self, tmp_path):
         """Error when not initialized."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("convert", "arc-aaa", cwd=tmp_path)
 
         assert result.returncode == 1
@@ -188,28 +160,22 @@ class TestConvertWithChildren:
     """Test converting outcome with children."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_children"], indirect=True)
-    def test_convert_outcome_with_children_blocked(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_with_children_blocked(self, arc_dir_with_fixture):
         """Outcome with children requires --force."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-aaa", "--parent", "arc-ddd", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
-        assert "has 2 children" in result.stderr
-        assert "--force" in result.stderr
+        assert_stderr_contains(result, "has 2 children", "--force")
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_children"], indirect=True)
-    def test_convert_outcome_with_force_orphans_children(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_outcome_with_force_orphans_children(self, arc_dir_with_fixture):
         """Converting outcome with --force makes children standalone."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-aaa", "--parent", "arc-ddd", "--force",
                          cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         # arc-aaa should be an action under arc-ddd
         assert items["arc-aaa"]["type"] == "action"
@@ -224,17 +190,14 @@ class TestConvertStandalone:
     """Test converting standalone actions."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["standalone_actions"], indirect=True)
-    def test_convert_standalone_action_to_outcome(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_standalone_action_to_outcome(self, arc_dir_with_fixture):
         """Standalone action converts to outcome."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "Converted arc-aaa to outcome" in result.stdout
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-aaa"]["type"] == "outcome"
         assert items["arc-aaa"].get("parent") is None
@@ -244,10 +207,8 @@ class TestConvertPrefixTolerance:
     """Test prefix-tolerant ID matching."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_with_prefix_tolerant_id(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_with_prefix_tolerant_id(self, arc_dir_with_fixture):
         """Convert works with ID without prefix."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # Use "ccc" instead of "arc-ccc"
         result = run_arc("convert", "ccc", cwd=arc_dir_with_fixture)
 
@@ -255,17 +216,14 @@ class TestConvertPrefixTolerance:
         assert "Converted arc-ccc to outcome" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["two_outcomes_no_children"], indirect=True)
-    def test_convert_with_prefix_tolerant_parent(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_with_prefix_tolerant_parent(self, arc_dir_with_fixture):
         """Convert works with parent ID without prefix."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # Use "aaa" instead of "arc-aaa" for parent
         result = run_arc("convert", "arc-bbb", "--parent", "aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         # Parent should be resolved to full ID
         assert items["arc-bbb"]["parent"] == "arc-aaa"
@@ -275,50 +233,40 @@ class TestConvertPreservesMetadata:
     """Test that convert preserves metadata."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_preserves_brief(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_preserves_brief(self, arc_dir_with_fixture):
         """Convert preserves brief."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # Get original brief
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        original = next(json.loads(line) for line in lines if json.loads(line)["id"] == "arc-ccc")
+        original = read_item(arc_dir_with_fixture, "arc-ccc")
         original_brief = original["brief"]
 
         result = run_arc("convert", "arc-ccc", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-ccc"]["brief"] == original_brief
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_preserves_id(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_preserves_id(self, arc_dir_with_fixture):
         """Convert preserves original ID."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-ccc", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        ids = [json.loads(line)["id"] for line in lines]
+        ids = [item["id"] for item in read_items(arc_dir_with_fixture)]
 
         assert "arc-ccc" in ids
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_preserves_status(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_preserves_status(self, arc_dir_with_fixture):
         """Convert preserves status (including done)."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-bbb is done
         result = run_arc("convert", "arc-bbb", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert items["arc-bbb"]["status"] == "done"
 
@@ -327,15 +275,12 @@ class TestConvertUpdatedAt:
     """Verify convert sets updated_at on the converted item."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_convert_action_sets_updated_at(self, arc_dir_with_fixture, monkeypatch):
+    def test_convert_action_sets_updated_at(self, arc_dir_with_fixture):
         """Converting action to outcome sets updated_at."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("convert", "arc-ccc", cwd=arc_dir_with_fixture)
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
+        items = by_id(read_items(arc_dir_with_fixture))
 
         assert "updated_at" in items["arc-ccc"]
-        assert ISO_RE.match(items["arc-ccc"]["updated_at"])
+        assert_iso_timestamp(items["arc-ccc"]["updated_at"])
@@ -1,15 +1,13 @@
 """Tests for arc help command."""
 
-from conftest import run_arc
+from conftest import run_arc, run_arc_subprocess
 
 
 class TestHelpBasic:
     """Test basic arc help behavior."""
 
-    def test_help_no_args(self, tmp_path, monkeypatch):
+    def test_help_no_args(self, tmp_path):
         """arc help shows main help."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("help", cwd=tmp_path)
 
         assert result.returncode == 0
@@ -18,10 +16,8 @@ class TestHelpBasic:
         assert "list" in result.stdout
         assert "done" in result.stdout
 
-    def test_help_specific_command(self, tmp_path, monkeypatch):
+    def test_help_specific_command(self, tmp_path):
         """arc help <command> shows command help."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("help", "new", cwd=tmp_path)
 
         assert result.returncode == 0
@@ -29,10 +25,8 @@ class TestHelpBasic:
         assert "--outcome" in result.stdout
         assert "--why" in result.stdout
 
-    def test_help_unknown_command(self, tmp_path, monkeypatch):
+    def test_help_unknown_command(self, tmp_path):
         """arc help <unknown> shows error."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("help", "nonexistent", cwd=tmp_path)
 
         assert result.returncode == 1
@@ -42,12 +36,29 @@ class TestHelpBasic:
 class TestHelpDoesNotRequireInit:
     """Help should work without .arc/ directory."""
 
-    def test_help_works_without_init(self, tmp_path, monkeypatch):
+    def test_help_works_without_init(self, tmp_path):
         """arc help works even when not initialized."""
-        monkeypatch.chdir(tmp_path)
         # No .arc/ directory
 
         result = run_arc("help", cwd=tmp_path)
 
         assert result.returncode == 0
         assert "usage:" in result.stdout.lower()
+
+
+class TestEntryPoint:
+    """`python -m bon.cli` works end to end (run_arc bypasses it in-process)."""
+
+    def test_module_entry_point_help(self, tmp_path):
+        """Module entry point prints help and exits 0."""
+        result = run_arc_subprocess("--help", cwd=tmp_path)
+
+        assert result.returncode == 0
+        assert "usage: bon" in result.stdout
+
+    def test_module_entry_point_error_exit(self, tmp_path):
+        """BonError surfaces as stderr message and exit code 1."""
+        result = run_arc_subprocess("list", cwd=tmp_path)
+
+        assert result.returncode == 1
+        assert "Error: Not initialized" in result.stderr
@@ -1,26 +1,22 @@
 """Tests for arc init command."""
 
 
-from conftest import run_arc
+from conftest import items_path, run_arc
 
 
-def test_init_creates_arc_directory(tmp_path, monkeypatch):
+def test_init_creates_arc_directory(tmp_path):
     """bon init creates .bon/ directory with items.jsonl and prefix."""
-    monkeypatch.chdir(tmp_path)
-
     result = run_arc("init", cwd=tmp_path)
 
     assert result.returncode == 0
     assert (tmp_path / ".bon").is_dir()
-    assert (tmp_path / ".bon" / "items.jsonl").exists()
+    assert items_path(tmp_path).exists()
     assert (tmp_path / ".bon" / "prefix").read_text() == "bon"
     assert "Initialized .bon/" in result.stdout
 
 
-def test_init_custom_prefix(tmp_path, monkeypatch):
+def test_init_custom_prefix(tmp_path):
     """bon init --prefix sets custom prefix."""
-    monkeypatch.chdir(tmp_path)
-
     result = run_arc("init", "--prefix", "myproject", cwd=tmp_path)
 
     assert result.returncode == 0
@@ -28,9 +24,8 @@ def test_init_custom_prefix(tmp_path, monkeypatch):
     assert "myproject" in result.stdout
 
 
-def test_init_already_exists(tmp_path, monkeypatch):
+def test_init_already_exists(tmp_path):
     """bon init when .bon/ exists errors."""
-    monkeypatch.chdir(tmp_path)
     (tmp_path / ".bon").mkdir()
 
     result = run_arc("init", cwd=tmp_path)
@@ -39,20 +34,16 @@ def test_init_already_exists(tmp_path, monkeypatch):
     assert ".bon/ already exists" in result.stderr
 
 
-def test_init_prefix_no_trailing_newline(tmp_path, monkeypatch):
+def test_init_prefix_no_trailing_newline(tmp_path):
     """Prefix file has no trailing newline."""
-    monkeypatch.chdir(tmp_path)
-
     run_arc("init", cwd=tmp_path)
 
     content = (tmp_path / ".bon" / "prefix").read_bytes()
     assert not content.endswith(b"\n")
 
 
-def test_init_prefix_with_hyphen_rejected(tmp_path, monkeypatch):
+def test_init_prefix_with_hyphen_rejected(tmp_path):
     """Prefix with hyphen is rejected."""
-    monkeypatch.chdir(tmp_path)
-
     result = run_arc("init", "--prefix", "my-project", cwd=tmp_path)
 
     assert result.returncode == 1
@@ -60,10 +51,8 @@ def test_init_prefix_with_hyphen_rejected(tmp_path, monkeypatch):
     assert not (tmp_path / ".bon").exists()
 
 
-def test_init_prefix_with_space_rejected(tmp_path, monkeypatch):
+def test_init_prefix_with_space_rejected(tmp_path):
     """Prefix with space is rejected."""
-    monkeypatch.chdir(tmp_path)
-
     result = run_arc("init", "--prefix", "my project", cwd=tmp_path)
 
     assert result.returncode == 1
@@ -71,10 +60,8 @@ def test_init_prefix_with_space_rejected(tmp_path, monkeypatch):
     assert not (tmp_path / ".bon").exists()
 
 
-def test_init_prefix_alphanumeric_accepted(tmp_path, monkeypatch):
+def test_init_prefix_alphanumeric_accepted(tmp_path):
     """Alphanumeric prefix is accepted."""
-    monkeypatch.chdir(tmp_path)
-
     result = run_arc("init", "--prefix", "myProject123", cwd=tmp_path)
 
     assert result.returncode == 0
@@ -2,7 +2,7 @@
 from unittest.mock import patch
 
 import pytest
-from conftest import run_arc
+from conftest import read_items, run_arc
 
 from bon.cli import prompt_brief
 from bon.storage import BonError
@@ -82,18 +82,14 @@ class TestInteractiveCLI:
                     main()
 
         # Verify item created
-        import json
-        items = (arc_dir / ".bon" / "items.jsonl").read_text().strip()
-        item = json.loads(items)
+        (item,) = read_items(arc_dir)
         assert item["title"] == "Interactive test"
         assert item["brief"]["why"] == "Test why"
         assert item["brief"]["what"] == "Test what"
         assert item["brief"]["done"] == "Test done"
 
-    def test_flags_bypass_interactive(self, arc_dir, monkeypatch):
+    def test_flags_bypass_interactive(self, arc_dir):
         """Providing all brief flags bypasses interactive prompt."""
-        monkeypatch.chdir(arc_dir)
-
         # Even with TTY, flags should bypass prompts
         result = run_arc(
             "new", "Non-interactive",
@@ -105,9 +101,7 @@ class TestInteractiveCLI:
 
         assert result.returncode == 0
 
-        import json
-        items = (arc_dir / ".bon" / "items.jsonl").read_text().strip()
-        item = json.loads(items)
+        (item,) = read_items(arc_dir)
         assert item["brief"]["why"] == "Flag why"
 
     def test_partial_flags_with_tty_uses_interactive(self, arc_dir, monkeypatch):
@@ -121,8 +115,6 @@ class TestInteractiveCLI:
                 with patch('sys.argv', ['arc', 'new', 'Partial flags', '--why', 'Ignored']):
                     main()
 
-        import json
-        items = (arc_dir / ".bon" / "items.jsonl").read_text().strip()
-        item = json.loads(items)
+        (item,) = read_items(arc_dir)
         # Interactive input should be used, not the flag
         assert item["brief"]["why"] == "Interactive why"
@@ -88,10 +88,8 @@ class TestListDefault:
         ("standalone_actions", EXPECTED_LIST_DEFAULT["standalone_actions"]),
         ("all_waiting", EXPECTED_LIST_DEFAULT["all_waiting"]),
     ], indirect=["arc_dir_with_fixture"])
-    def test_list_default(self, arc_dir_with_fixture, expected, monkeypatch):
+    def test_list_default(self, arc_dir_with_fixture, expected):
         """arc list output matches expected for each fixture."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0, f"stderr: {result.stderr}"
@@ -106,10 +104,8 @@ class TestListReady:
         ("waiting_dependency", EXPECTED_LIST_READY["waiting_dependency"]),
         ("all_waiting", EXPECTED_LIST_READY["all_waiting"]),
     ], indirect=["arc_dir_with_fixture"])
-    def test_list_ready(self, arc_dir_with_fixture, expected, monkeypatch):
+    def test_list_ready(self, arc_dir_with_fixture, expected):
         """arc list --ready shows ready and done actions for context."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--ready", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0, f"stderr: {result.stderr}"
@@ -123,10 +119,8 @@ class TestListWaiting:
         ("waiting_dependency", EXPECTED_LIST_WAITING["waiting_dependency"]),
         ("all_waiting", EXPECTED_LIST_WAITING["all_waiting"]),
     ], indirect=["arc_dir_with_fixture"])
-    def test_list_waiting(self, arc_dir_with_fixture, expected, monkeypatch):
+    def test_list_waiting(self, arc_dir_with_fixture, expected):
         """arc list --waiting shows only waiting actions."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--waiting", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0, f"stderr: {result.stderr}"
@@ -136,10 +130,8 @@ class TestListWaiting:
 class TestListNotInitialized:
     """Test arc list when not initialized."""
 
-    def test_error_when_not_initialized(self, tmp_path, monkeypatch):
+    def test_error_when_not_initialized(self, tmp_path):
         """Error when .arc/ doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("list", cwd=tmp_path)
 
         assert result.returncode == 1
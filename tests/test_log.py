@@ -123,9 +123,8 @@ def test_log_shows_unwaited_verb(arc_dir_with_fixture):
 
 
 @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-def test_log_shows_stepped_verb(arc_dir_with_fixture, monkeypatch):
+def test_log_shows_stepped_verb(arc_dir_with_fixture):
     """Stepping shows 'stepped' verb in log."""
-    monkeypatch.chdir(arc_dir_with_fixture)
     run_arc("step", cwd=arc_dir_with_fixture)
     result = run_arc("log", cwd=arc_dir_with_fixture)
     assert result.returncode == 0
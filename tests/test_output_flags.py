@@ -2,17 +2,15 @@
 import json
 
 import pytest
-from conftest import run_arc
+from conftest import assert_ids, run_arc
 
 
 class TestJsonOutput:
     """Test --json flag."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_list_json(self, arc_dir_with_fixture, monkeypatch):
+    def test_list_json(self, arc_dir_with_fixture):
         """arc list --json outputs nested JSON."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--json", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -25,10 +23,8 @@ class TestJsonOutput:
         assert len(data["outcomes"][0]["actions"]) == 2
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_show_json(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_json(self, arc_dir_with_fixture):
         """arc show --json outputs item as JSON."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-aaa", "--json", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -42,14 +38,12 @@ class TestJsonlOutput:
     """Test --jsonl flag."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_list_jsonl(self, arc_dir_with_fixture, monkeypatch):
+    def test_list_jsonl(self, arc_dir_with_fixture):
         """arc list --jsonl outputs flat JSONL."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--jsonl", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
-        lines = result.stdout.strip().split("\n")
+        lines = result.stdout.splitlines()
         assert len(lines) == 3  # 1 outcome + 2 actions
 
         # Each line should be valid JSON
@@ -61,10 +55,8 @@ class TestJsonlOutput:
 class TestQuietOutput:
     """Test --quiet flag."""
 
-    def test_new_quiet(self, arc_dir, monkeypatch):
+    def test_new_quiet(self, arc_dir):
         """arc new --quiet outputs only the ID."""
-        monkeypatch.chdir(arc_dir)
-
         result = run_arc(
             "new", "Test", "-q",
             "--why", "w", "--what", "x", "--done", "d",
@@ -77,10 +69,8 @@ class TestQuietOutput:
         assert output.startswith("arc-")
         assert "Created:" not in result.stdout
 
-    def test_new_quiet_long_flag(self, arc_dir, monkeypatch):
+    def test_new_quiet_long_flag(self, arc_dir):
         """arc new --quiet works with long flag."""
-        monkeypatch.chdir(arc_dir)
-
         result = run_arc(
             "new", "Test", "--quiet",
             "--why", "w", "--what", "x", "--done", "d",
@@ -97,62 +87,44 @@ class TestJsonlWithFilters:
     """Test --jsonl respects filters."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_list_jsonl_ready(self, arc_dir_with_fixture, monkeypatch):
+    def test_list_jsonl_ready(self, arc_dir_with_fixture):
         """arc list --jsonl --ready shows only ready items."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--jsonl", "--ready", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
-        lines = result.stdout.strip().split("\n")
-        items = [json.loads(line) for line in lines]
+        items = [json.loads(line) for line in result.stdout.splitlines()]
 
-        # Should have outcome and ready action only (arc-ccc), not waiting action (arc-bbb)
-        ids = {item["id"] for item in items}
-        assert "arc-aaa" in ids  # outcome
-        assert "arc-ccc" in ids  # ready action
-        assert "arc-bbb" not in ids  # waiting action should be filtered out
+        # Outcome and ready action (arc-ccc), not waiting action (arc-bbb)
+        assert_ids(items, present=["arc-aaa", "arc-ccc"], absent=["arc-bbb"])
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_list_jsonl_waiting(self, arc_dir_with_fixture, monkeypatch):
+    def test_list_jsonl_waiting(self, arc_dir_with_fixture):
         """arc list --jsonl --waiting shows only waiting items."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--jsonl", "--waiting", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
-        lines = result.stdout.strip().split("\n")
-        items = [json.loads(line) for line in lines]
+        items = [json.loads(line) for line in result.stdout.splitlines()]
 
-        # Should have outcome and waiting action only
-        ids = {item["id"] for item in items}
-        assert "arc-aaa" in ids  # outcome (open outcomes included)
-        assert "arc-bbb" in ids  # waiting action
-        assert "arc-ccc" not in ids  # ready action should be filtered out
+        # Open outcome and waiting action (arc-bbb), not ready action (arc-ccc)
+        assert_ids(items, present=["arc-aaa", "arc-bbb"], absent=["arc-ccc"])
 
 
 class TestJsonWithFilters:
     """Test --json respects filters."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_list_json_ready(self, arc_dir_with_fixture, monkeypatch):
+    def test_list_json_ready(self, arc_dir_with_fixture):
         """arc list --json --ready shows only ready items."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("list", "--json", "--ready", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         data = json.loads(result.stdout)
 
-        # Collect all item IDs from nested structure
-        ids = set()
+        # Flatten the nested outcomes/actions structure
+        items = list(data.get("standalone", []))
         for outcome in data.get("outcomes", []):
-            ids.add(outcome["id"])
-            for action in outcome.get("actions", []):
-                ids.add(action["id"])
-        for action in data.get("standalone", []):
-            ids.add(action["id"])
-
-        assert "arc-aaa" in ids  # outcome
-        assert "arc-ccc" in ids  # ready action
-        assert "arc-bbb" not in ids  # waiting action should be filtered out
+            items.append(outcome)
+            items.extend(outcome.get("actions", []))
+
+        # Outcome and ready action (arc-ccc), not waiting action (arc-bbb)
+        assert_ids(items, present=["arc-aaa", "arc-ccc"], absent=["arc-bbb"])
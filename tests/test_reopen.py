@@ -1,13 +1,6 @@
 """Tests for arc reopen command."""
-import json
-import re
-
 import pytest
-
-from conftest import run_arc
-
-ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
-
+from conftest import assert_iso_timestamp, by_id, load_jsonl, read_item, read_items, run_arc
 
 # --- Basic ---
 
@@ -21,8 +14,7 @@ def test_reopen_done_item(arc_dir_with_fixture):
     assert "Reopened: arc-aaa" in result.stdout
 
     # Item is open again
-    show = run_arc("show", "arc-aaa", "--json", cwd=arc_dir_with_fixture)
-    item = json.loads(show.stdout)
+    item = read_item(arc_dir_with_fixture, "arc-aaa")
     assert item["status"] == "open"
     assert "done_at" not in item
 
@@ -52,12 +44,10 @@ def test_reopen_clears_done_at(arc_dir_with_fixture):
     run_arc("done", "arc-ccc", cwd=arc_dir_with_fixture)
 
     # Confirm done_at exists
-    show = run_arc("show", "arc-ccc", "--json", cwd=arc_dir_with_fixture)
-    assert "done_at" in json.loads(show.stdout)
+    assert "done_at" in read_item(arc_dir_with_fixture, "arc-ccc")
 
     run_arc("reopen", "arc-ccc", cwd=arc_dir_with_fixture)
-    show = run_arc("show", "arc-ccc", "--json", cwd=arc_dir_with_fixture)
-    item = json.loads(show.stdout)
+    item = read_item(arc_dir_with_fixture, "arc-ccc")
     assert "done_at" not in item
     assert item["status"] == "open"
 
@@ -68,18 +58,13 @@ def test_reopen_clears_done_at(arc_dir_with_fixture):
 @pytest.mark.parametrize("arc_dir_with_fixture", ["action_tactical_complete"], indirect=True)
 def test_reopen_preserves_tactical(arc_dir_with_fixture):
     """Tactical steps are preserved when reopening."""
-    # action_tactical_complete has a done action with completed tactical
-    items_path = arc_dir_with_fixture / ".bon" / "items.jsonl"
-    items = [json.loads(l) for l in items_path.read_text().splitlines() if l.strip()]
-    # Find the action with tactical
-    action = next(i for i in items if i.get("tactical"))
-    action_id = action["id"]
+    # action_tactical_complete: arc-child is done with all tactical steps complete
+    action_id = "arc-child"
 
     result = run_arc("reopen", action_id, cwd=arc_dir_with_fixture)
     assert result.returncode == 0
 
-    show = run_arc("show", action_id, "--json", cwd=arc_dir_with_fixture)
-    reopened = json.loads(show.stdout)
+    reopened = read_item(arc_dir_with_fixture, action_id)
     assert reopened["status"] == "open"
     assert "tactical" in reopened
 
@@ -87,35 +72,30 @@ def test_reopen_preserves_tactical(arc_dir_with_fixture):
 # --- Reopen from archive ---
 
 
-@pytest.mark.parametrize("arc_dir_with_fixture", ["done_outcome_with_actions"], indirect=True)
+@pytest.mark.parametrize(
+    "arc_dir_with_fixture", ["all_archived_outcome_with_actions"], indirect=True
+)
 def test_reopen_from_archive(arc_dir_with_fixture):
     """Reopen an archived item restores it to items.jsonl."""
-    # Archive first
-    run_arc("archive", "--all", cwd=arc_dir_with_fixture)
-
-    # Confirm items.jsonl is empty
-    items_path = arc_dir_with_fixture / ".bon" / "items.jsonl"
-    assert items_path.read_text().strip() == ""
-
+    # Fixture starts with everything archived and items.jsonl empty
     # Reopen one item
     result = run_arc("reopen", "arc-bbb", cwd=arc_dir_with_fixture)
     assert result.returncode == 0
     assert "restored from archive" in result.stdout
 
     # Item is back in items.jsonl
-    items = [json.loads(l) for l in items_path.read_text().splitlines() if l.strip()]
-    ids = {i["id"] for i in items}
-    assert "arc-bbb" in ids
+    items = by_id(read_items(arc_dir_with_fixture))
+    assert "arc-bbb" in items
 
     # Item is open, no done_at or archived_at
-    restored = next(i for i in items if i["id"] == "arc-bbb")
+    restored = items["arc-bbb"]
     assert restored["status"] == "open"
     assert "done_at" not in restored
     assert "archived_at" not in restored
 
     # Archive file has the other two still
     archive_path = arc_dir_with_fixture / ".bon" / "archive.jsonl"
-    archived = [json.loads(l) for l in archive_path.read_text().splitlines() if l.strip()]
+    archived = load_jsonl(archive_path)
     archived_ids = {a["id"] for a in archived}
     assert "arc-bbb" not in archived_ids
     assert "arc-aaa" in archived_ids
@@ -157,8 +137,6 @@ class TestReopenUpdatedAt:
         result = run_arc("reopen", "arc-bbb", cwd=arc_dir_with_fixture)
         assert result.returncode == 0
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = {json.loads(line)["id"]: json.loads(line) for line in lines}
-
-        assert "updated_at" in items["arc-bbb"]
-        assert ISO_RE.match(items["arc-bbb"]["updated_at"])
+        item = read_item(arc_dir_with_fixture, "arc-bbb")
+        assert "updated_at" in item
+        assert_iso_timestamp(item["updated_at"])
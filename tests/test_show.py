@@ -7,10 +7,8 @@ class TestShowOutcome:
     """Test arc show for outcomes."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_show_outcome_with_actions(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_outcome_with_actions(self, arc_dir_with_fixture):
         """arc show displays outcome with all its actions."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -31,10 +29,8 @@ class TestShowOutcome:
         assert "2. ○ Add UI (arc-ccc)" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_show_outcome_no_actions(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_outcome_no_actions(self, arc_dir_with_fixture):
         """arc show displays outcome without actions section when empty."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -46,10 +42,8 @@ class TestShowAction:
     """Test arc show for actions."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_show_action(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_action(self, arc_dir_with_fixture):
         """arc show displays action details."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-bbb", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -59,10 +53,8 @@ class TestShowAction:
         assert "Actions:" not in result.stdout  # Actions don't show nested actions
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_show_waiting_action(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_waiting_action(self, arc_dir_with_fixture):
         """arc show displays waiting status."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-bbb", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -73,19 +65,15 @@ class TestShowErrors:
     """Test arc show error cases."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_show_not_found(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_not_found(self, arc_dir_with_fixture):
         """Error when item doesn't exist."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "arc-nonexistent", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "Item 'arc-nonexistent' not found" in result.stderr
 
-    def test_show_not_initialized(self, tmp_path, monkeypatch):
+    def test_show_not_initialized(self, tmp_path):
         """Error when not initialized."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("show", "arc-aaa", cwd=tmp_path)
 
         assert result.returncode == 1
@@ -96,10 +84,8 @@ class TestShowCurrent:
     """Test arc show --current with active tactical steps."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_show_current_with_active_tactical(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_current_with_active_tactical(self, arc_dir_with_fixture):
         """arc show --current outputs working line and tactical steps."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "--current", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -110,10 +96,8 @@ class TestShowCurrent:
         assert "3. Step three" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_show_current_no_active_tactical(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_current_no_active_tactical(self, arc_dir_with_fixture):
         """arc show --current silently exits when no tactical steps active."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "--current", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -124,10 +108,8 @@ class TestShowPrefixTolerant:
     """Test prefix-tolerant ID matching."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_show_by_suffix(self, arc_dir_with_fixture, monkeypatch):
+    def test_show_by_suffix(self, arc_dir_with_fixture):
         """Can show item by suffix only."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("show", "aaa", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -6,10 +6,8 @@ from conftest import run_arc
 class TestStatusBasic:
     """Test basic arc status behavior."""
 
-    def test_status_empty(self, arc_dir, monkeypatch):
+    def test_status_empty(self, arc_dir):
         """arc status on empty repo."""
-        monkeypatch.chdir(arc_dir)
-
         result = run_arc("status", cwd=arc_dir)
 
         assert result.returncode == 0
@@ -18,10 +16,8 @@ class TestStatusBasic:
         assert "Actions:    0 open (0 ready, 0 waiting), 0 done" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_status_single_outcome(self, arc_dir_with_fixture, monkeypatch):
+    def test_status_single_outcome(self, arc_dir_with_fixture):
         """arc status with one outcome."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -29,10 +25,8 @@ class TestStatusBasic:
         assert "Actions:    0 open" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_status_with_actions(self, arc_dir_with_fixture, monkeypatch):
+    def test_status_with_actions(self, arc_dir_with_fixture):
         """arc status with actions (one done, one open)."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -41,10 +35,8 @@ class TestStatusBasic:
         assert "Actions:    1 open (1 ready, 0 waiting), 1 done" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_status_with_waiting(self, arc_dir_with_fixture, monkeypatch):
+    def test_status_with_waiting(self, arc_dir_with_fixture):
         """arc status shows waiting count."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -52,10 +44,8 @@ class TestStatusBasic:
         assert "Actions:    2 open (1 ready, 1 waiting), 0 done" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["standalone_actions"], indirect=True)
-    def test_status_standalone(self, arc_dir_with_fixture, monkeypatch):
+    def test_status_standalone(self, arc_dir_with_fixture):
         """arc status shows standalone count."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -65,10 +55,8 @@ class TestStatusBasic:
 class TestStatusErrors:
     """Test arc status error cases."""
 
-    def test_status_not_initialized(self, tmp_path, monkeypatch):
+    def test_status_not_initialized(self, tmp_path):
         """Error when not initialized."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("status", cwd=tmp_path)
 
         assert result.returncode == 1
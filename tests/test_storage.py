@@ -1,10 +1,10 @@
 """Tests for storage operations."""
-import json
-
 import pytest
+from conftest import by_id, dump_jsonl, items_path, read_items
 
 from bon.storage import (
     ValidationError,
+    build_id_index,
     find_by_id,
     load_items,
     load_prefix,
@@ -27,7 +27,7 @@ class TestLoadItems:
         """Load a single valid item."""
         monkeypatch.chdir(arc_dir)
         item = {"id": "arc-aaa", "type": "outcome", "title": "Test", "status": "open"}
-        (arc_dir / ".bon" / "items.jsonl").write_text(json.dumps(item) + "\n")
+        dump_jsonl(items_path(arc_dir), [item])
 
         items = load_items()
 
@@ -40,7 +40,7 @@ class TestLoadItems:
         content = '{"id": "arc-aaa", "type": "outcome", "title": "Good", "status": "open"}\n'
         content += 'not valid json\n'
         content += '{"id": "arc-bbb", "type": "action", "title": "Also good", "status": "open"}\n'
-        (arc_dir / ".bon" / "items.jsonl").write_text(content)
+        items_path(arc_dir).write_text(content)
 
         items = load_items()
 
@@ -100,8 +100,7 @@ class TestLoadItemsDedup:
         """Duplicate IDs produce a warning."""
         monkeypatch.chdir(arc_dir)
         item = {"id": "arc-aaa", "type": "outcome", "title": "Test", "status": "open"}
-        content = json.dumps(item) + "\n" + json.dumps(item) + "\n"
-        (arc_dir / ".bon" / "items.jsonl").write_text(content)
+        dump_jsonl(items_path(arc_dir), [item, item])
 
         items = load_items()
 
@@ -118,8 +117,7 @@ class TestLoadItemsDedup:
         new = {"id": "arc-aaa", "type": "outcome", "title": "New", "status": "done",
                "created_at": "2026-01-01T00:00:00Z", "done_at": "2026-02-01T00:00:00Z"}
         # Old appears after new — but new should still win because done_at is more recent
-        content = json.dumps(new) + "\n" + json.dumps(old) + "\n"
-        (arc_dir / ".bon" / "items.jsonl").write_text(content)
+        dump_jsonl(items_path(arc_dir), [new, old])
 
         items = load_items()
 
@@ -135,8 +133,7 @@ class TestLoadItemsDedup:
         new = {"id": "arc-aaa", "type": "outcome", "title": "Edited", "status": "open",
                "created_at": "2026-01-01T00:00:00Z", "updated_at": "2026-02-01T00:00:00Z"}
         # Old appears after new — but new should win because updated_at is more recent
-        content = json.dumps(new) + "\n" + json.dumps(old) + "\n"
-        (arc_dir / ".bon" / "items.jsonl").write_text(content)
+        dump_jsonl(items_path(arc_dir), [new, old])
 
         items = load_items()
 
@@ -154,7 +151,7 @@ class TestLoadItemsDedup:
             '{"id": "arc-bbb", "type": "action", "title": "Theirs", "status": "done"}\n'
             '>>>>>>> branch\n'
         )
-        (arc_dir / ".bon" / "items.jsonl").write_text(content)
+        items_path(arc_dir).write_text(content)
 
         items = load_items()
 
@@ -196,12 +193,11 @@ class TestSaveItems:
         save_items(items)
 
         # Check raw file — not load_items, which also deduplicates
-        raw_lines = (arc_dir / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        assert len(raw_lines) == 2
-        saved = [json.loads(line) for line in raw_lines]
-        aaa = next(i for i in saved if i["id"] == "arc-aaa")
-        assert aaa["title"] == "New"
-        assert any(i["id"] == "arc-bbb" for i in saved)
+        items = read_items(arc_dir)
+        assert len(items) == 2
+        saved = by_id(items)
+        assert saved["arc-aaa"]["title"] == "New"
+        assert "arc-bbb" in saved
 
         captured = capsys.readouterr()
         assert "Deduplicated" in captured.err
@@ -256,6 +252,20 @@ class TestFindById:
 
         assert result["id"] == "arc-aaa"
 
+    def test_indexed_matches_scan(self):
+        """Lookups through build_id_index agree with the linear scan."""
+        items = [
+            {"id": "arc-aaa", "type": "outcome", "title": "First"},
+            {"id": "arc-bbb", "type": "action"},
+            {"id": "arc-aaa", "type": "outcome", "title": "Duplicate"},
+        ]
+        index = build_id_index(items)
+
+        for needle in ["arc-aaa", "bbb", "arc-zzz", "zzz"]:
+            expected = find_by_id(items, needle, prefix="arc")
+            assert find_by_id(items, needle, prefix="arc", index=index) is expected
+        assert find_by_id(items, "arc-aaa", index=index)["title"] == "First"
+
 
 class TestLoadPrefix:
     def test_default_prefix(self, arc_dir, monkeypatch):
@@ -12,6 +12,7 @@ def test_update_shows_in_help():
     assert "update" in result.stdout
 
 
+@pytest.mark.slow
 def test_update_no_arc_dir_needed(tmp_path):
     """bon update should work without .bon/ directory (it's a meta-command)."""
     result = run_arc("update", cwd=tmp_path)
@@ -19,6 +20,7 @@ def test_update_no_arc_dir_needed(tmp_path):
     assert "Not a bon project" not in result.stderr
 
 
+@pytest.mark.slow
 @pytest.mark.skipif(not shutil.which("uv"), reason="uv not available")
 def test_update_runs():
     """arc update re-installs from source."""
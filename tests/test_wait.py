@@ -1,77 +1,47 @@
 """Tests for arc wait command."""
-import json
-import re
 
 import pytest
-from conftest import run_arc
-
-ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+from conftest import assert_iso_timestamp, read_item, run_arc
 
 
 class TestWaitBasic:
     """Test basic arc wait behavior."""
 
-    @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_wait_sets_waiting_for(self, arc_dir_with_fixture, monkeypatch):
-        """arc wait sets waiting_for field."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
-        result = run_arc("wait", "arc-aaa", "some-blocker", cwd=arc_dir_with_fixture)
-
-        assert result.returncode == 0
-        assert "arc-aaa now waiting for: some-blocker" in result.stdout
-
-        # Verify the item was updated
-        item = json.loads((arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip())
-        assert item["waiting_for"] == "some-blocker"
-
-    @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_wait_prefix_tolerant(self, arc_dir_with_fixture, monkeypatch):
-        """arc wait works with suffix-only ID."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
-        result = run_arc("wait", "aaa", "some-blocker", cwd=arc_dir_with_fixture)
-
-        assert result.returncode == 0
-        assert "arc-aaa now waiting for:" in result.stdout
-
-    @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_wait_with_item_id(self, arc_dir_with_fixture, monkeypatch):
-        """arc wait can reference another item ID."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
-        result = run_arc("wait", "arc-ccc", "arc-bbb", cwd=arc_dir_with_fixture)
-
-        assert result.returncode == 0
-
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        ccc = json.loads(lines[2])
-        assert ccc["waiting_for"] == "arc-bbb"
-
-    @pytest.mark.parametrize("arc_dir_with_fixture", ["waiting_dependency"], indirect=True)
-    def test_wait_overwrites_previous(self, arc_dir_with_fixture, monkeypatch):
-        """arc wait overwrites previous waiting_for."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
+    @pytest.mark.parametrize("arc_dir_with_fixture,wait_id,item_id,reason,expected_stdout", [
+        pytest.param(
+            "single_outcome", "arc-aaa", "arc-aaa", "some-blocker",
+            "arc-aaa now waiting for: some-blocker",
+            id="sets-waiting-for",
+        ),
+        pytest.param(
+            "single_outcome", "aaa", "arc-aaa", "some-blocker",
+            "arc-aaa now waiting for:",
+            id="prefix-tolerant",
+        ),
+        pytest.param(
+            "outcome_with_actions", "arc-ccc", "arc-ccc", "arc-bbb",
+            "arc-ccc now waiting for: arc-bbb",
+            id="item-id-reason",
+        ),
         # arc-bbb is already waiting for arc-ccc
-        result = run_arc("wait", "arc-bbb", "new-reason", cwd=arc_dir_with_fixture)
+        pytest.param(
+            "waiting_dependency", "arc-bbb", "arc-bbb", "new-reason",
+            "arc-bbb now waiting for: new-reason",
+            id="overwrites-previous",
+        ),
+    ], indirect=["arc_dir_with_fixture"])
+    def test_wait_sets_reason(self, arc_dir_with_fixture, wait_id, item_id, reason, expected_stdout):
+        """arc wait reports and stores waiting_for on the resolved item."""
+        result = run_arc("wait", wait_id, reason, cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
+        assert expected_stdout in result.stdout
+        assert read_item(arc_dir_with_fixture, item_id)["waiting_for"] == reason
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        bbb = json.loads(lines[1])
-        assert bbb["waiting_for"] == "new-reason"
-
-    def test_wait_free_text_reason(self, arc_dir, monkeypatch):
+    @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
+    def test_wait_free_text_reason(self, arc_dir_with_fixture):
         """arc wait accepts free text as reason."""
-        monkeypatch.chdir(arc_dir)
-
-        # Create an item first
-        run_arc("new", "Test", "--why", "w", "--what", "x", "--done", "d", cwd=arc_dir)
-        lines = (arc_dir / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        item_id = json.loads(lines[0])["id"]
-
-        result = run_arc("wait", item_id, "security review approval", cwd=arc_dir)
+        result = run_arc("wait", "arc-aaa", "security review approval", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "security review approval" in result.stdout
@@ -81,19 +51,15 @@ class TestWaitErrors:
     """Test arc wait error cases."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_wait_not_found(self, arc_dir_with_fixture, monkeypatch):
+    def test_wait_not_found(self, arc_dir_with_fixture):
         """Error when item doesn't exist."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("wait", "arc-nonexistent", "reason", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "Item 'arc-nonexistent' not found" in result.stderr
 
-    def test_wait_not_initialized(self, tmp_path, monkeypatch):
+    def test_wait_not_initialized(self, tmp_path):
         """Error when not initialized."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("wait", "arc-aaa", "reason", cwd=tmp_path)
 
         assert result.returncode == 1
@@ -104,10 +70,8 @@ class TestWaitWarnings:
     """Test arc wait warning behavior."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_wait_warns_on_nonexistent_id(self, arc_dir_with_fixture, monkeypatch):
+    def test_wait_warns_on_nonexistent_id(self, arc_dir_with_fixture):
         """Warning when waiting_for looks like an arc ID but doesn't exist."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("wait", "arc-ccc", "arc-nonexistent", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -115,20 +79,16 @@ class TestWaitWarnings:
         assert "arc-ccc now waiting for:" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_wait_no_warn_on_valid_id(self, arc_dir_with_fixture, monkeypatch):
+    def test_wait_no_warn_on_valid_id(self, arc_dir_with_fixture):
         """No warning when waiting_for references a real item."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("wait", "arc-ccc", "arc-bbb", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "not found" not in result.stderr
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_wait_no_warn_on_free_text(self, arc_dir_with_fixture, monkeypatch):
+    def test_wait_no_warn_on_free_text(self, arc_dir_with_fixture):
         """No warning when waiting_for is free text."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("wait", "arc-ccc", "external security review", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -139,12 +99,10 @@ class TestWaitUpdatedAt:
     """Verify wait sets updated_at timestamp."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_wait_sets_updated_at(self, arc_dir_with_fixture, monkeypatch):
+    def test_wait_sets_updated_at(self, arc_dir_with_fixture):
         """arc wait sets updated_at on the item."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         run_arc("wait", "arc-aaa", "blocker", cwd=arc_dir_with_fixture)
 
-        item = json.loads((arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip())
+        item = read_item(arc_dir_with_fixture, "arc-aaa")
         assert "updated_at" in item
-        assert ISO_RE.match(item["updated_at"])
+        assert_iso_timestamp(item["updated_at"])
@@ -1,70 +1,49 @@
 """Tests for arc work command."""
-import json
-import re
 
 import pytest
-from conftest import run_arc
+from conftest import assert_iso_timestamp, assert_stderr_contains, new_item, read_item, run_arc
 
-ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+from bon.cli import parse_steps_from_what
 
 
 class TestParseStepsFromWhat:
     """Unit tests for parse_steps_from_what."""
 
-    def test_single_line(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1. First 2. Second 3. Third") == ["First", "Second", "Third"]
-
-    def test_newlines_between_steps(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1. First\n2. Second\n3. Third") == ["First", "Second", "Third"]
-
-    def test_newlines_within_steps_normalized(self):
-        """Newlines within step text should be collapsed to spaces."""
-        from bon.cli import parse_steps_from_what
-        result = parse_steps_from_what("1. First step\nwith detail\n2. Second step\n3. Third")
-        assert result == ["First step with detail", "Second step", "Third"]
-
-    def test_version_numbers_not_split(self):
-        """v2.0 should not be treated as step boundary."""
-        from bon.cli import parse_steps_from_what
-        result = parse_steps_from_what("1. Create v2.0 config 2. Test 3. Ship")
-        assert result == ["Create v2.0 config", "Test", "Ship"]
-
-    def test_paren_style_delimiters(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1) First 2) Second 3) Third") == ["First", "Second", "Third"]
-
-    def test_trailing_newline(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1. First\n2. Second\n") == ["First", "Second"]
-
-    def test_double_newlines(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1. First\n\n2. Second\n\n3. Third") == ["First", "Second", "Third"]
-
-    def test_no_steps_returns_none(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("Just some text with no numbers") is None
-
-    def test_single_step(self):
-        from bon.cli import parse_steps_from_what
-        assert parse_steps_from_what("1. Only one step") == ["Only one step"]
-
-    def test_preamble_text_ignored(self):
-        from bon.cli import parse_steps_from_what
-        result = parse_steps_from_what("Setup: 1. Config 2. Test 3. Deploy")
-        assert result == ["Config", "Test", "Deploy"]
+    @pytest.mark.parametrize("what,expected", [
+        pytest.param("1. First 2. Second 3. Third", ["First", "Second", "Third"],
+                     id="single-line"),
+        pytest.param("1. First\n2. Second\n3. Third", ["First", "Second", "Third"],
+                     id="newlines-between-steps"),
+        # Newlines within step text are collapsed to spaces
+        pytest.param("1. First step\nwith detail\n2. Second step\n3. Third",
+                     ["First step with detail", "Second step", "Third"],
+                     id="newlines-within-steps-normalized"),
+        # v2.0 is not a step boundary
+        pytest.param("1. Create v2.0 config 2. Test 3. Ship", ["Create v2.0 config", "Test", "Ship"],
+                     id="version-numbers-not-split"),
+        pytest.param("1) First 2) Second 3) Third", ["First", "Second", "Third"],
+                     id="paren-style-delimiters"),
+        pytest.param("1. First\n2. Second\n", ["First", "Second"],
+                     id="trailing-newline"),
+        pytest.param("1. First\n\n2. Second\n\n3. Third", ["First", "Second", "Third"],
+                     id="double-newlines"),
+        pytest.param("Just some text with no numbers", None,
+                     id="no-steps-returns-none"),
+        pytest.param("1. Only one step", ["Only one step"],
+                     id="single-step"),
+        pytest.param("Setup: 1. Config 2. Test 3. Deploy", ["Config", "Test", "Deploy"],
+                     id="preamble-text-ignored"),
+    ])
+    def test_parse(self, what, expected):
+        assert parse_steps_from_what(what) == expected
 
 
 class TestWorkParseWhat:
     """Test parsing steps from --what field."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_parses_what(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_parses_what(self, arc_dir_with_fixture):
         """arc work parses numbered steps from --what."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # First, update arc-ccc to have numbered steps in --what
         result = run_arc(
             "edit", "arc-ccc",
@@ -82,10 +61,8 @@ class TestWorkParseWhat:
         assert "3. Test integration" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_parses_multiline_what(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_parses_multiline_what(self, arc_dir_with_fixture):
         """arc work correctly parses steps from multiline --what."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # Set --what with embedded newlines (as Claude might produce)
         result = run_arc(
             "edit", "arc-ccc",
@@ -106,10 +83,8 @@ class TestWorkExplicitSteps:
     """Test providing explicit steps."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_explicit_steps(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_explicit_steps(self, arc_dir_with_fixture):
         """arc work accepts explicit steps as arguments."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc(
             "work", "arc-ccc",
             "Step A", "Step B", "Step C",
@@ -126,10 +101,8 @@ class TestWorkProseErrors:
     """Test error when --what has no numbered steps."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_prose_what_errors(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_prose_what_errors(self, arc_dir_with_fixture):
         """arc work errors when --what has prose without numbers."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-ccc has "Login button in header, redirect flow" - no numbers
         result = run_arc("work", "arc-ccc", cwd=arc_dir_with_fixture)
 
@@ -141,51 +114,37 @@ class TestWorkOutcomeErrors:
     """Test error when trying to add steps to outcome."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_outcome_errors_with_children(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_outcome_errors_with_children(self, arc_dir_with_fixture):
         """arc work on outcome with children shows them."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "arc-aaa", "Step 1", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
-        assert "is an outcome" in result.stderr
-        assert "Tactical steps are for actions" in result.stderr
-        assert "Did you mean one of its actions?" in result.stderr
-        assert "arc-ccc" in result.stderr  # Shows child action
+        assert_stderr_contains(
+            result,
+            "is an outcome",
+            "Tactical steps are for actions",
+            "Did you mean one of its actions?",
+            "arc-ccc",  # Shows child action
+        )
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["single_outcome"], indirect=True)
-    def test_work_outcome_errors_no_children(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_outcome_errors_no_children(self, arc_dir_with_fixture):
         """arc work on outcome without children suggests creating one."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "arc-aaa", "Step 1", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
-        assert "is an outcome" in result.stderr
-        assert "No actions yet" in result.stderr
-        assert "bon new" in result.stderr
+        assert_stderr_contains(result, "is an outcome", "No actions yet", "bon new")
 
 
 class TestWorkSerialEnforcement:
     """Test serial execution constraint."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_another_active_errors(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_another_active_errors(self, arc_dir_with_fixture):
         """arc work errors when another action has active steps."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-child already has tactical steps in progress
         # Try to create a new action and work on it
-        result = run_arc(
-            "new", "Another action",
-            "--for", "arc-parent",
-            "--why", "Test", "--what", "Test", "--done", "Test",
-            cwd=arc_dir_with_fixture
-        )
-        assert result.returncode == 0
-
-        # Get the new action ID
-        new_id = result.stdout.strip().replace("Created: ", "")
+        new_id = new_item(arc_dir_with_fixture, "Another action", "--for", "arc-parent")
 
         # Now try to work on the new action
         result = run_arc("work", new_id, "Step 1", cwd=arc_dir_with_fixture)
@@ -198,22 +157,17 @@ class TestWorkProgressProtection:
     """Test protection of in-progress steps."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_progress_requires_force(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_progress_requires_force(self, arc_dir_with_fixture):
         """arc work errors when steps in progress, unless --force."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-child has tactical at current=1
         result = run_arc("work", "arc-child", "New steps", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
-        assert "Steps in progress" in result.stderr
-        assert "--force" in result.stderr
+        assert_stderr_contains(result, "Steps in progress", "--force")
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_force_restarts(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_force_restarts(self, arc_dir_with_fixture):
         """arc work --force restarts steps."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc(
             "work", "arc-child", "--force",
             "New step A", "New step B",
@@ -228,10 +182,8 @@ class TestWorkStatus:
     """Test arc work --status."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_status_shows_current(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_status_shows_current(self, arc_dir_with_fixture):
         """arc work --status shows current tactical state."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "--status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -241,10 +193,8 @@ class TestWorkStatus:
         assert "3. Step three" in result.stdout
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_status_no_tactical(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_status_no_tactical(self, arc_dir_with_fixture):
         """arc work --status when no tactical active."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "--status", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -255,26 +205,20 @@ class TestWorkClear:
     """Test arc work --clear."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_clear(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_clear(self, arc_dir_with_fixture):
         """arc work --clear removes tactical steps."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "--clear", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
         assert "Cleared tactical steps from arc-child" in result.stdout
 
         # Verify tactical removed
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        items = [json.loads(line) for line in lines]
-        child = next(i for i in items if i["id"] == "arc-child")
+        child = read_item(arc_dir_with_fixture, "arc-child")
         assert "tactical" not in child
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_clear_no_tactical(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_clear_no_tactical(self, arc_dir_with_fixture):
         """arc work --clear is silent when no tactical active."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "--clear", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 0
@@ -285,10 +229,8 @@ class TestWorkDoneAction:
     """Test errors on done actions."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_done_action_errors(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_done_action_errors(self, arc_dir_with_fixture):
         """arc work errors on already-done actions."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         # arc-bbb is done
         result = run_arc("work", "arc-bbb", "Step 1", cwd=arc_dir_with_fixture)
 
@@ -300,28 +242,22 @@ class TestWorkErrors:
     """Test various error cases."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_not_found(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_not_found(self, arc_dir_with_fixture):
         """arc work errors when item not found."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         result = run_arc("work", "arc-nonexistent", cwd=arc_dir_with_fixture)
 
         assert result.returncode == 1
         assert "not found" in result.stderr
 
-    def test_work_not_initialized(self, tmp_path, monkeypatch):
+    def test_work_not_initialized(self, tmp_path):
         """arc work errors when not initialized."""
-        monkeypatch.chdir(tmp_path)
-
         result = run_arc("work", "arc-aaa", cwd=tmp_path)
 
         assert result.returncode == 1
         assert "Not initialized" in result.stderr
 
-    def test_work_no_args(self, arc_dir, monkeypatch):
+    def test_work_no_args(self, arc_dir):
         """arc work with no args errors."""
-        monkeypatch.chdir(arc_dir)
-
         result = run_arc("work", cwd=arc_dir)
 
         assert result.returncode == 1
@@ -332,25 +268,19 @@ class TestWorkUpdatedAt:
     """Verify work sets updated_at timestamp."""
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["outcome_with_actions"], indirect=True)
-    def test_work_sets_updated_at(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_sets_updated_at(self, arc_dir_with_fixture):
         """arc work sets updated_at on the item."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         run_arc("work", "arc-ccc", "Step A", "Step B", cwd=arc_dir_with_fixture)
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        ccc = json.loads(lines[2])
+        ccc = read_item(arc_dir_with_fixture, "arc-ccc")
         assert "updated_at" in ccc
-        assert ISO_RE.match(ccc["updated_at"])
+        assert_iso_timestamp(ccc["updated_at"])
 
     @pytest.mark.parametrize("arc_dir_with_fixture", ["action_with_tactical"], indirect=True)
-    def test_work_clear_sets_updated_at(self, arc_dir_with_fixture, monkeypatch):
+    def test_work_clear_sets_updated_at(self, arc_dir_with_fixture):
         """arc work --clear sets updated_at on the item."""
-        monkeypatch.chdir(arc_dir_with_fixture)
-
         run_arc("work", "--clear", cwd=arc_dir_with_fixture)
 
-        lines = (arc_dir_with_fixture / ".bon" / "items.jsonl").read_text().strip().split("\n")
-        child = next(json.loads(line) for line in lines if json.loads(line)["id"] == "arc-child")
+        child = read_item(arc_dir_with_fixture, "arc-child")
         assert "updated_at" in child
-        assert ISO_RE.match(child["updated_at"])
+        assert_iso_timestamp(child["updated_at"])